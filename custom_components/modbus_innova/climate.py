@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -37,19 +38,30 @@ if TYPE_CHECKING:
 
 CALL_TYPE_WRITE_REGISTER = "write_register"
 CONF_HUB = "hub"
+CONF_FULL_POLL_EVERY = "full_poll_every"
+
+_SLAVE_VALIDATOR = vol.All(int, vol.Range(min=0, max=254))
+_TEMP_VALIDATOR = vol.All(int, vol.Range(min=5, max=40))
 
 PLATFORM_SCHEMA = CLIMATE_PLATFORM_SCHEMA.extend(
     {
         vol.Optional(CONF_HUB, default=DEFAULT_HUB): cv.string,
-        vol.Required(CONF_SLAVE): vol.All(int, vol.Range(min=0, max=254)),
+        vol.Required(CONF_SLAVE): _SLAVE_VALIDATOR,
         vol.Optional(CONF_NAME, default=DEVICE_DEFAULT_NAME): cv.string,
-        vol.Optional(CONF_MIN_TEMP, default=5): vol.All(int, vol.Range(min=5, max=40)),
-        vol.Optional(CONF_MAX_TEMP, default=40): vol.All(int, vol.Range(min=5, max=40)),
+        vol.Optional(CONF_MIN_TEMP, default=5): _TEMP_VALIDATOR,
+        vol.Optional(CONF_MAX_TEMP, default=40): _TEMP_VALIDATOR,
+        vol.Optional(CONF_FULL_POLL_EVERY, default=10): vol.All(int, vol.Range(min=1)),
     }
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_FAN_MODES = ("Auto", "Silent", "Night", "High")
+_HVAC_MODES = (HVACMode.COOL, HVACMode.HEAT, HVACMode.OFF)
+# Fan mode encoded in the three least significant bits of the PRG register
+_FAN_MODE_BY_PRG_LOW3 = (*_FAN_MODES, None, None, None, None)
+_SEASON_TO_HVAC = {5: HVACMode.COOL, 3: HVACMode.HEAT, 0: HVACMode.HEAT}
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -67,8 +79,21 @@ async def async_setup_platform(
 class InnovaFancoil(ClimateEntity):
     """Representation of a fancoil AC unit."""
 
-    _attr_fan_modes: ClassVar[list[str]] = ["Auto", "Silent", "Night", "High"]
-    _attr_hvac_modes: ClassVar[list[str]] = [HVACMode.COOL, HVACMode.HEAT, HVACMode.OFF]
+    # Only the non-_attr_* attributes set in __init__ are slotted; the _attr_* ones, including
+    # _attr_actual_air_speed, stay in the __dict__ that Entity keeps
+    __slots__ = (
+        "_alarm",
+        "_cached_prg",
+        "_extra_attributes",
+        "_full_poll_every",
+        "_hub",
+        "_skipped_polls",
+        "_slave",
+        "_water_temperature",
+    )
+
+    _attr_fan_modes: list[str] | None = list(_FAN_MODES)  # noqa: RUF012
+    _attr_hvac_modes: list[HVACMode] = list(_HVAC_MODES)  # noqa: RUF012
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.FAN_MODE
@@ -93,81 +118,96 @@ class InnovaFancoil(ClimateEntity):
         self._alarm = False
         self._water_temperature: int | None = None
         self._attr_actual_air_speed: int | None = None
+        # Last known PRG register value, used to skip the read in read-modify-write commands
+        self._cached_prg: int | None = None
+        # Device specific state attributes, replaced only when one of the values changes
+        self._extra_attributes: dict[str, Any] = {"water_temperature": None, "fan_speed": None}
+        # While the unit is off only the settings block is polled, the status block every Nth poll
+        self._full_poll_every: int = config[CONF_FULL_POLL_EVERY]
+        self._skipped_polls = 0
 
         self._attr_min_temp = config[CONF_MIN_TEMP]
         self._attr_max_temp = config[CONF_MAX_TEMP]
 
     async def async_update(self) -> None:
         """Update unit attributes."""
-        self._attr_target_temperature = await self._async_read_temp_from_register(
-            CALL_TYPE_REGISTER_HOLDING, 231
-        )
-        self._attr_current_temperature = await self._async_read_temp_from_register(
-            CALL_TYPE_REGISTER_HOLDING, 0
-        )
-
-        self._attr_actual_air_speed = await self._async_read_int16_from_register(
-            CALL_TYPE_REGISTER_HOLDING, 15
-        )
+        if (
+            self._cached_prg is not None
+            and self._cached_prg & 0x80
+            and self._skipped_polls < self._full_poll_every - 1
+        ):
+            settings = await self._async_read_registers_block(CALL_TYPE_REGISTER_HOLDING, 201, 33)
+            if settings is None:
+                return
+            if settings[0] & 0x80:
+                self._skipped_polls += 1
+                self._update_from_settings(settings)
+                return
+            status = await self._async_read_registers_block(CALL_TYPE_REGISTER_HOLDING, 0, 16)
+        else:
+            status, settings = await asyncio.gather(
+                self._async_read_registers_block(CALL_TYPE_REGISTER_HOLDING, 0, 16),
+                self._async_read_registers_block(CALL_TYPE_REGISTER_HOLDING, 201, 33),
+            )
+        if status is None or settings is None:
+            return
 
-        self._water_temperature = await self._async_read_int16_from_register(CALL_TYPE_REGISTER_HOLDING, 1)
+        self._skipped_polls = 0
+        self._update_from_status(status)
+        self._update_from_settings(settings)
 
-        prg = await self._async_read_int16_from_register(CALL_TYPE_REGISTER_HOLDING, 201)
+    def _update_from_status(self, status: list[int]) -> None:
+        """Update attributes from the status registers block (0-15)."""
+        current_temperature, self._water_temperature, self._attr_actual_air_speed = (
+            InnovaFancoil._parse_block(status, (0, 1, 15))
+        )
+        self._attr_current_temperature = current_temperature / 10.0
 
         if (
-            not InnovaFancoil._is_set(prg, 0)
-            and not InnovaFancoil._is_set(prg, 1)
-            and not InnovaFancoil._is_set(prg, 2)
-        ):
-            self._attr_fan_mode = self._attr_fan_modes[0]
-        elif (
-            InnovaFancoil._is_set(prg, 0)
-            and not InnovaFancoil._is_set(prg, 1)
-            and not InnovaFancoil._is_set(prg, 2)
-        ):
-            self._attr_fan_mode = self._attr_fan_modes[1]
-        elif (
-            not InnovaFancoil._is_set(prg, 0)
-            and InnovaFancoil._is_set(prg, 1)
-            and not InnovaFancoil._is_set(prg, 2)
-        ):
-            self._attr_fan_mode = self._attr_fan_modes[2]
-        elif (
-            InnovaFancoil._is_set(prg, 0)
-            and InnovaFancoil._is_set(prg, 1)
-            and not InnovaFancoil._is_set(prg, 2)
+            self._extra_attributes["water_temperature"] != self._water_temperature
+            or self._extra_attributes["fan_speed"] != self._attr_actual_air_speed
         ):
-            self._attr_fan_mode = self._attr_fan_modes[3]
-        else:
+            self._extra_attributes = {
+                "water_temperature": self._water_temperature,
+                "fan_speed": self._attr_actual_air_speed,
+            }
+
+    def _update_from_settings(self, settings: list[int]) -> None:
+        """Update attributes from the settings registers block (201-233)."""
+        prg, target_temperature, season = InnovaFancoil._parse_block(settings, (0, 30, 32))
+        self._cached_prg = prg
+
+        self._attr_target_temperature = target_temperature / 10.0
+
+        fan_mode = _FAN_MODE_BY_PRG_LOW3[prg & 0b111]
+        if fan_mode is None:
             _LOGGER.error("Received invalid PRG")
             return
+        self._attr_fan_mode = fan_mode
 
-        season = await self._async_read_int16_from_register(CALL_TYPE_REGISTER_HOLDING, 233)
-
-        if season == 5:  # noqa: PLR2004
-            self._attr_hvac_mode = HVACMode.COOL
-        elif season in (3, 0):
-            self._attr_hvac_mode = HVACMode.HEAT
-        else:
+        hvac_mode = _SEASON_TO_HVAC.get(season)
+        if hvac_mode is None:
             _LOGGER.error("Received invalid season value: %s", season)
             return
+        self._attr_hvac_mode = hvac_mode
 
-        if InnovaFancoil._is_set(prg, 7):
+        # PRG bit 7 (0x80) is set while the unit is off
+        if prg & 0x80:
             self._attr_hvac_mode = HVACMode.OFF
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return device specific state attributes."""
-        return {
-            "water_temperature": self._water_temperature,
-            "fan_speed": self._attr_actual_air_speed,
-        }
+        return self._extra_attributes
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set new HVAC Mode."""
-        curr_prg = await self._async_read_int16_from_register(CALL_TYPE_REGISTER_HOLDING, 201)
+        curr_prg = await self._async_read_prg()
+        if curr_prg is None:
+            _LOGGER.error("Modbus error reading PRG, hvac mode not set")
+            return
         if hvac_mode == HVACMode.OFF:
-            await self._async_write_int16_to_register(201, (curr_prg | (1 << 7)))
+            await self._async_write_prg(curr_prg | 0x80)
             return
         if hvac_mode == HVACMode.COOL:
             season = 5
@@ -177,7 +217,10 @@ class InnovaFancoil(ClimateEntity):
             _LOGGER.error("Modbus error setting hvac mode")
             return
 
-        await self._async_write_int16_to_register(201, (curr_prg & ~(1 << 7)))
+        # Only clear the OFF bit of a PRG value read successfully above: switching between
+        # cool and heat while on leaves PRG untouched
+        if curr_prg & 0x80:
+            await self._async_write_prg(curr_prg & 0xFF7F)
         await self._async_write_int16_to_register(233, season)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -193,20 +236,17 @@ class InnovaFancoil(ClimateEntity):
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode."""
-        index = self._attr_fan_modes.index(fan_mode)
+        index = _FAN_MODES.index(fan_mode)
 
-        curr_prg = await self._async_read_int16_from_register(CALL_TYPE_REGISTER_HOLDING, 201)
+        curr_prg = await self._async_read_prg()
+        if curr_prg is None:
+            _LOGGER.error("Modbus error reading PRG, fan mode not set")
+            return
 
-        if index == 0:
-            curr_prg = curr_prg & ~0b111
-        elif index == 1:
-            curr_prg = curr_prg & ~0b111 | 0b001
-        elif index == 2:  # noqa: PLR2004
-            curr_prg = curr_prg & ~0b111 | 0b010
-        else:
-            curr_prg = curr_prg & ~0b111 | 0b011
+        # Fan mode indices 0..3 match the PRG bit patterns 0b000..0b011
+        curr_prg = (curr_prg & ~0b111) | (index & 0b011)
 
-        if self.fan_modes and await self._async_write_int16_to_register(201, curr_prg):
+        if await self._async_write_prg(curr_prg):
             self._attr_fan_mode = fan_mode
         else:
             _LOGGER.error("Modbus error setting fan mode")
@@ -221,15 +261,35 @@ class InnovaFancoil(ClimateEntity):
 
         return int(result.registers[0])
 
-    async def _async_read_temp_from_register(self, register_type: str, register: int) -> float:
-        result = float(await self._async_read_int16_from_register(register_type, register))
-        if not result:
-            return -1
-        return result / 10.0
+    async def _async_read_registers_block(
+        self, register_type: str, register: int, count: int
+    ) -> list[int] | None:
+        """Read a contiguous block of registers in a single Modbus transaction."""
+        result = await self._hub.async_pb_call(self._slave, register, count, register_type)
+        if result is None:
+            _LOGGER.error("Error reading registers %s-%s from fancoil", register, register + count - 1)
+            return None
 
-    async def _async_write_int16_to_register(self, register: int, value: int) -> bool:
-        return await self._hub.async_pb_call(self._slave, register, value, CALL_TYPE_WRITE_REGISTER)
+        return result.registers
 
     @staticmethod
-    def _is_set(x: int, n: int) -> bool:
-        return x & 1 << n != 0
+    def _parse_block(registers: list[int], offsets: tuple[int, ...]) -> tuple[int, ...]:
+        """Pick the registers at the given offsets from a block read."""
+        return tuple(registers[offset] for offset in offsets)
+
+    async def _async_write_int16_to_register(self, register: int, value: int) -> bool:
+        result = await self._hub.async_pb_call(self._slave, register, value, CALL_TYPE_WRITE_REGISTER)
+        return result is not None
+
+    async def _async_read_prg(self) -> int | None:
+        """Return the PRG register, reading it from the unit only if no value is cached."""
+        if self._cached_prg is not None:
+            return self._cached_prg
+        prg = await self._async_read_int16_from_register(CALL_TYPE_REGISTER_HOLDING, 201)
+        return None if prg == -1 else prg
+
+    async def _async_write_prg(self, value: int) -> bool:
+        """Write the PRG register and keep the cached value in sync."""
+        result = await self._async_write_int16_to_register(201, value)
+        self._cached_prg = value if result else None
+        return result